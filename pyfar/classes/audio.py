@@ -7,6 +7,7 @@ audio data. More details and background is given in the concepts (
 """
 
 from copy import deepcopy
+import math
 import warnings
 import deepdiff
 import numpy as np
@@ -25,10 +26,14 @@ class _Audio():
     # (e.g. __rmul__)
     __array_priority__ = 1.0
 
-    def __init__(self, domain, comment=None):
+    # valid parameter spaces (shared by all instances)
+    _VALID_DOMAINS = ("time", "freq")
+
+    # attributes that earlier versions stored in each instance. They might
+    # be contained in files and are ignored when decoding objects
+    _OBSOLETE_ATTRIBUTES = ("_VALID_DOMAINS", "_VALID_FFT_NORMS")
 
-        # initialize valid parameter spaces
-        self._VALID_DOMAINS = ["time", "freq"]
+    def __init__(self, domain, comment=None):
 
         # initialize global parameters
         self.comment = comment
@@ -93,7 +98,7 @@ class _Audio():
             reshaped._data = reshaped._data.reshape(
                 newshape + (length_last_dimension, ))
         except ValueError:
-            if np.prod(newshape) != np.prod(self.cshape):
+            if math.prod(newshape) != math.prod(self.cshape):
                 raise ValueError((f"Can not reshape audio object of cshape "
                                   f"{self.cshape} to {newshape}"))
 
@@ -115,7 +120,7 @@ class _Audio():
         ``cshape=(12, )`` and ``n_samples=512`` after flattening.
 
         """
-        newshape = int(np.prod(self.cshape))
+        newshape = math.prod(self.cshape)
 
         return self.reshape(newshape)
 
@@ -131,7 +136,25 @@ class _Audio():
 
     def copy(self):
         """Return a copy of the audio object."""
-        return deepcopy(self)
+        return self._copy_with_data(self._data.copy())
+
+    def _copy_with_data(self, data):
+        """
+        Return a copy of the audio object that holds `data`.
+
+        The meta data is copied and `data` is set without any checks. It must
+        thus match the meta data, which is the case for copies and for slicing
+        channels.
+        """
+        # copy arrays directly and deep copy only the remaining attributes,
+        # which avoids the overhead of deep copying the entire object
+        obj = self.__class__.__new__(self.__class__)
+        obj.__dict__ = {
+            key: value.copy() if isinstance(value, np.ndarray)
+            else deepcopy(value) for key, value in self.__dict__.items()
+            if key != '_data'}
+        obj._data = data
+        return obj
 
     def _return_item(self):
         raise NotImplementedError("To be implemented by derived classes.")
@@ -141,16 +164,26 @@ class _Audio():
 
     def _encode(self):
         """Return dictionary for the encoding."""
-        class_dict = self.copy().__dict__
+        class_dict = self.__dict__.copy()
         return class_dict
 
     def _decode(self):
         """Return dictionary for the encoding."""
         raise NotImplementedError("To be implemented by derived classes.")
 
+    def _update_decoded(self, obj_dict):
+        """Set attributes from a decoded dictionary except obsolete ones."""
+        self.__dict__.update({
+            key: value for key, value in obj_dict.items()
+            if key not in self._OBSOLETE_ATTRIBUTES})
+
     def __getitem__(self, key):
         """
-        Get copied slice of the audio object at key.
+        Get slice of the audio object at key.
+
+        As for numpy arrays, the data of the slice is a view of the data of
+        the audio object if `key` uses basic slicing, e.g., integers and
+        slices. Use ``audio[key].copy()`` to get an independent object.
 
         Examples
         --------
@@ -162,7 +195,11 @@ class _Audio():
 
 
         """
-        data = self._data[key]
+        data = np.atleast_2d(self._data[key])
+        if data.shape[-1] == self._data.shape[-1]:
+            # slicing channels does not change the meta data. It is copied
+            # instead of checking it again when creating a new object
+            return self._copy_with_data(data)
         return self._return_item(data)
 
     def __setitem__(self, key, value):
@@ -213,7 +250,8 @@ class TimeData(_Audio):
         if self._times.size != self.n_samples:
             raise ValueError(
                 "The length of times must be data.shape[-1]")
-        if np.any(np.diff(self._times) <= 0) and len(self._times) > 1:
+        # compare neighbouring values without computing their difference
+        if np.any(self._times[1:] <= self._times[:-1]):
             raise ValueError("Times must be monotonously increasing.")
 
     @property
@@ -226,12 +264,11 @@ class TimeData(_Audio):
         """Set the time data."""
         # check and set the data and meta data
         data = np.atleast_2d(np.asarray(value))
-        if data.dtype.kind == "i":
-            data = data.astype("float")
-        elif data.dtype.kind != "f":
+        if data.dtype.kind not in ["i", "f"]:
             raise ValueError(
                 f"time data is {data.dtype}  must be int or float")
-        data = np.atleast_2d(np.asarray(value, dtype=float))
+        # convert to float only once and without copying float data
+        data = data.astype(float, copy=False)
         self._data = data
         self._n_samples = data.shape[-1]
         # setting the domain is only required for Signal. Setting it here
@@ -267,11 +304,7 @@ class TimeData(_Audio):
             The index for the given time instance. If the input was an array
             like, a numpy array of indices is returned.
         """
-        times = np.atleast_1d(value)
-        indices = np.zeros_like(times).astype(int)
-        for idx, time in enumerate(times):
-            indices[idx] = np.argmin(np.abs(self.times - time))
-        return np.squeeze(indices)
+        return _find_nearest(self.times, value)
 
     def _assert_matching_meta_data(self, other):
         """
@@ -303,7 +336,7 @@ class TimeData(_Audio):
             obj_dict['_data'],
             obj_dict['_times'],
             obj_dict['_comment'])
-        obj.__dict__.update(obj_dict)
+        obj._update_decoded(obj_dict)
         return obj
 
     def __add__(self, data):
@@ -392,7 +425,8 @@ class FrequencyData(_Audio):
         self.freq = data
 
         # check frequencies
-        if np.any(np.diff(freqs) <= 0) and len(frequencies) > 1:
+        # compare neighbouring values without computing their difference
+        if np.any(freqs[1:] <= freqs[:-1]):
             raise ValueError("Frequencies must be monotonously increasing.")
         if len(freqs) != self.n_bins:
             raise ValueError(
@@ -446,11 +480,7 @@ class FrequencyData(_Audio):
             The index for the given frequency. If the input was an array like,
             a numpy array of indices is returned.
         """
-        freqs = np.atleast_1d(value)
-        indices = np.zeros_like(freqs).astype(int)
-        for idx, freq in enumerate(freqs):
-            indices[idx] = np.argmin(np.abs(self.frequencies - freq))
-        return np.squeeze(indices)
+        return _find_nearest(self.frequencies, value)
 
     def _assert_matching_meta_data(self, other):
         """Check if the meta data matches across two FrequencyData objects."""
@@ -483,7 +513,7 @@ class FrequencyData(_Audio):
             obj_dict['_data'],
             obj_dict['_frequencies'],
             obj_dict['_comment'])
-        obj.__dict__.update(obj_dict)
+        obj._update_decoded(obj_dict)
         return obj
 
     def __add__(self, data):
@@ -534,6 +564,13 @@ class Signal(FrequencyData, TimeData):
     frequency domain.
 
     """
+    # valid FFT normalizations (shared by all instances)
+    _VALID_FFT_NORMS = (
+        "none", "unitary", "amplitude", "rms", "power", "psd")
+
+    # earlier versions also stored the times of signals
+    _OBSOLETE_ATTRIBUTES = _Audio._OBSOLETE_ATTRIBUTES + ("_times", )
+
     def __init__(
             self,
             data,
@@ -581,8 +618,6 @@ class Signal(FrequencyData, TimeData):
 
         # initialize signal specific parameters
         self._sampling_rate = sampling_rate
-        self._VALID_FFT_NORMS = [
-            "none", "unitary", "amplitude", "rms", "power", "psd"]
 
         # check fft norm
         if fft_norm in self._VALID_FFT_NORMS:
@@ -596,10 +631,11 @@ class Signal(FrequencyData, TimeData):
 
         # initialize domain specific parameters
         if domain == 'time':
-            self._n_samples = data.shape[-1]
-            times = np.atleast_1d(
-                np.arange(0, self._n_samples) / sampling_rate)
-            TimeData.__init__(self, data, times, comment)
+            # the times of a Signal are derived from the sampling rate and
+            # are not stored (see Signal.times). This also avoids checking
+            # if they are monotonously increasing.
+            _Audio.__init__(self, 'time', comment)
+            self.time = data
         elif domain == 'freq':
             # check and set n_samples
             if n_samples is None:
@@ -610,10 +646,16 @@ class Signal(FrequencyData, TimeData):
             elif n_samples > 2 * data.shape[-1] - 1:
                 raise ValueError(("n_samples can not be larger than "
                                   "2 * data.shape[-1] - 2"))
+            if data.shape[-1] != fft._n_bins(n_samples):
+                raise ValueError(
+                    "Number of frequencies does not match number of data "
+                    "points")
             self._n_samples = n_samples
-            # Init remaining parameters
-            FrequencyData.__init__(self, data, self.frequencies, comment)
-            delattr(self, '_frequencies')
+            # the frequencies of a Signal are derived from the sampling rate
+            # and the number of samples and are not stored and checked (see
+            # Signal.frequencies)
+            _Audio.__init__(self, 'freq', comment)
+            self.freq = data
         else:
             raise ValueError("Invalid domain. Has to be 'time' or 'freq'.")
 
@@ -660,7 +702,8 @@ class Signal(FrequencyData, TimeData):
         data_denorm = fft.normalization(
                 data, self._n_samples, self._sampling_rate,
                 self._fft_norm, inverse=True)
-        self._data = data_denorm.astype(complex)
+        # convert to complex only once and without copying complex data
+        self._data = data_denorm.astype(complex, copy=False)
 
     @property
     def freq_raw(self):
@@ -689,7 +732,8 @@ class Signal(FrequencyData, TimeData):
                 "number of samples from the number of frequency bins.")))
             self._n_samples = (data.shape[-1] - 1)*2
         self._domain = 'freq'
-        self._data = data.astype(complex)
+        # convert to complex only once and without copying complex data
+        self._data = data.astype(complex, copy=False)
 
     @_Audio.domain.setter
     def domain(self, new_domain):
@@ -726,12 +770,12 @@ class Signal(FrequencyData, TimeData):
     @property
     def times(self):
         """Time instances the signal is sampled at."""
-        return np.atleast_1d(np.arange(0, self.n_samples) / self.sampling_rate)
+        return np.arange(self.n_samples) / self.sampling_rate
 
     @property
     def frequencies(self):
         """Frequencies of the discrete signal spectrum."""
-        return np.atleast_1d(fft.rfftfreq(self.n_samples, self.sampling_rate))
+        return fft.rfftfreq(self.n_samples, self.sampling_rate)
 
     @property
     def n_bins(self):
@@ -782,9 +826,13 @@ class Signal(FrequencyData, TimeData):
 
     def _encode(self):
         """Return dictionary for the encoding."""
-        selfcopy = self.copy()
-        selfcopy.domain = "time"
-        class_dict = selfcopy.__dict__
+        class_dict = self.__dict__.copy()
+        # write time data without changing the domain of the signal
+        if self.domain == 'freq':
+            class_dict['_data'] = fft.irfft(
+                self._data, self.n_samples, self._sampling_rate,
+                fft_norm='none')
+            class_dict['_domain'] = 'time'
         return class_dict
 
     @classmethod
@@ -794,7 +842,7 @@ class Signal(FrequencyData, TimeData):
             obj_dict['_data'],
             obj_dict['_sampling_rate'],
             obj_dict['_n_samples'])
-        obj.__dict__.update(obj_dict)
+        obj._update_decoded(obj_dict)
         return obj
 
     @property
@@ -905,7 +953,7 @@ def add(data: tuple, domain='freq'):
       same normalization.
     * Other combinations raise an error.
     """
-    return _arithmetic(data, domain, _add)
+    return _arithmetic(data, domain, np.add)
 
 
 def subtract(data: tuple, domain='freq'):
@@ -950,7 +998,7 @@ def subtract(data: tuple, domain='freq'):
       same normalization.
     * Other combinations raise an error.
     """
-    return _arithmetic(data, domain, _subtract)
+    return _arithmetic(data, domain, np.subtract)
 
 
 def multiply(data: tuple, domain='freq'):
@@ -995,7 +1043,7 @@ def multiply(data: tuple, domain='freq'):
       same normalization.
     * Other combinations raise an error.
     """
-    return _arithmetic(data, domain, _multiply)
+    return _arithmetic(data, domain, np.multiply)
 
 
 def divide(data: tuple, domain='freq'):
@@ -1039,7 +1087,7 @@ def divide(data: tuple, domain='freq'):
       normalization ``'none'``.
     * Other combinations raise an error.
    """
-    return _arithmetic(data, domain, _divide)
+    return _arithmetic(data, domain, np.true_divide)
 
 
 def power(data: tuple, domain='freq'):
@@ -1083,7 +1131,7 @@ def power(data: tuple, domain='freq'):
       same normalization.
     * Other combinations raise an error.
     """
-    return _arithmetic(data, domain, _power)
+    return _arithmetic(data, domain, np.power)
 
 
 def matrix_multiplication(
@@ -1253,26 +1301,53 @@ def matrix_multiplication(
     return _arithmetic(data, domain, _matrix_multiplication, axes=axes)
 
 
+# values that do not change the result if they are the right operand
+_IDENTITIES = {
+    np.add: 0, np.subtract: 0, np.multiply: 1, np.true_divide: 1,
+    np.power: 1}
+
+
 def _arithmetic(data: tuple, domain: str, operation: Callable, **kwargs):
     """Apply arithmetic operations."""
 
     # check input and obtain meta data of new signal
-    division = True if operation == _divide else False
+    division = True if operation == np.true_divide else False
     matmul = True if operation == _matrix_multiplication else False
     sampling_rate, n_samples, fft_norm, times, frequencies, audio_type, \
-        cshape = \
+        cshape, data = \
         _assert_match_for_arithmetic(data, domain, division, matmul)
 
     # apply arithmetic operation
-    result = _get_arithmetic_data(data[0], domain, cshape, matmul, audio_type)
+    operands = [_get_arithmetic_data(d, domain, cshape, matmul, audio_type)
+                for d in data]
+    dtype = np.result_type(*operands)
 
-    for d in range(1, len(data)):
+    if matmul or dtype.kind not in ["f", "c"]:
         if matmul:
             kwargs['audio_type'] = audio_type
-        result = operation(
-            result,
-            _get_arithmetic_data(data[d], domain, cshape, matmul, audio_type),
-            **kwargs)
+        # the operands are not copied. Copy the first one if no operation is
+        # applied to avoid returning the data of the input
+        result = operands[0] if len(operands) > 1 else operands[0].copy()
+        for operand in operands[1:]:
+            result = operation(result, operand, **kwargs)
+    else:
+        # allocate the result once with its final shape and type and apply
+        # all operations in place
+        result = np.empty(
+            np.broadcast_shapes(*[operand.shape for operand in operands]),
+            dtype)
+        # skip operands that do not change the result, e.g., adding zero or
+        # multiplying with one
+        identity = _IDENTITIES.get(operation)
+        operands = [operands[0]] + [
+            operand for operand in operands[1:]
+            if operand.size != 1 or operand.item() != identity]
+        if len(operands) == 1:
+            np.copyto(result, operands[0])
+        else:
+            operation(operands[0], operands[1], out=result)
+        for operand in operands[2:]:
+            operation(result, operand, out=result)
 
     # check if to return an audio object
     if audio_type == Signal:
@@ -1327,6 +1402,8 @@ def _assert_match_for_arithmetic(data: tuple, domain: str, division: bool,
     cshape : tuple, None
         Largest channel shape of the audio classes if contained in data.
         Otherwise empty tuple.
+    data : tuple
+        The input data with array likes converted to numpy arrays.
 
     """
 
@@ -1349,6 +1426,7 @@ def _assert_match_for_arithmetic(data: tuple, domain: str, division: bool,
 
     # check input types and meta data
     found_audio_data = False
+    checked_data = []
     for n, d in enumerate(data):
         if isinstance(d, (Signal, TimeData, FrequencyData)):
             # store meta data upon first appearance
@@ -1403,15 +1481,20 @@ def _assert_match_for_arithmetic(data: tuple, domain: str, division: bool,
 
         # check type of non signal input
         else:
-            if np.asarray(d).dtype.kind not in ["i", "f", "c"]:
+            # convert only once and pass the array on to avoid converting
+            # array likes again when getting the arithmetic data
+            d = np.asarray(d)
+            if d.dtype.kind not in ["i", "f", "c"]:
                 raise ValueError(
                     "Input must be of type Signal, int, float, or complex")
-            if np.asarray(d).dtype.kind == "c" and domain == 'time':
+            if d.dtype.kind == "c" and domain == 'time':
                 raise ValueError(
                     "Complex input can not be applied in the time domain.")
 
+        checked_data.append(d)
+
     return (sampling_rate, n_samples, fft_norm, times, frequencies, audio_type,
-            cshape)
+            cshape, tuple(checked_data))
 
 
 def _get_arithmetic_data(data, domain, cshape, matmul, audio_type):
@@ -1436,17 +1519,18 @@ def _get_arithmetic_data(data, domain, cshape, matmul, audio_type):
     -------
     data_out : numpy array
         Data in desired domain without any fft normalization if data is a
-        Signal. `np.asarray(data)` otherwise.
+        Signal. `np.asarray(data)` otherwise. The data is not copied and must
+        not be changed in place.
     """
     if isinstance(data, (Signal, TimeData, FrequencyData)):
         # get signal in correct domain
         if domain == "time":
-            data_out = data.time.copy()
+            data_out = data.time
         elif domain == "freq":
             if isinstance(data, Signal):
-                data_out = data.freq_raw.copy()
+                data_out = data.freq_raw
             else:
-                data_out = data.freq.copy()
+                data_out = data.freq
         else:
             raise ValueError(
                 f"domain must be 'time' or 'freq' but found {domain}")
@@ -1463,26 +1547,6 @@ def _get_arithmetic_data(data, domain, cshape, matmul, audio_type):
     return data_out
 
 
-def _add(a, b):
-    return a + b
-
-
-def _subtract(a, b):
-    return a - b
-
-
-def _multiply(a, b):
-    return a * b
-
-
-def _divide(a, b):
-    return a / b
-
-
-def _power(a, b):
-    return a**b
-
-
 def _matrix_multiplication(a, b, axes, audio_type):
     if not isinstance(None, audio_type):
         # adjust data and axes if output is a pyfar audio object
@@ -1574,3 +1638,25 @@ def _match_fft_norm(fft_norm_1, fft_norm_2, division=False):
                               f"they are {fft_norm_1} and {fft_norm_2}."))
 
     return fft_norm_result
+
+
+def _find_nearest(axis, value):
+    """
+    Return the indices of the entries in `axis` that are closest to `value`.
+
+    `axis` must be monotonously increasing, which is ensured for the times
+    and frequencies of audio objects. This allows to find the indices by a
+    binary search instead of computing the distances to all entries. If two
+    entries are equally close, the index of the smaller one is returned.
+    """
+    values = np.atleast_1d(np.asarray(value))
+    if axis.size == 1:
+        return np.squeeze(np.zeros(values.shape, dtype=int))
+
+    # index of the first entry that is larger or equal than the value. The
+    # nearest entry is either this one or the preceding one.
+    indices = np.searchsorted(axis, values)
+    indices = np.clip(indices, 1, axis.size - 1)
+    indices -= (values - axis[indices - 1]) <= (axis[indices] - values)
+
+    return np.squeeze(indices)
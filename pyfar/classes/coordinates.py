@@ -1007,12 +1007,12 @@ class Coordinates():
 
         # wrap range if coordinate is cyclic
         if c_info[0] == 'cyclic':
-            low = c_info[1][0]
-            upp = c_info[1][1]
-            if rng[0] < c_info[1][0] - atol:
-                rng[0] = (rng[0] - low) % (upp - low) + low
-            if rng[1] > c_info[1][1] + atol:
-                rng[1] = (rng[1] - low) % (upp - low) + low
+            low, upp = c_info[1]
+            span = upp - low
+            if rng[0] < low - atol:
+                rng[0] = (rng[0] - low) % span + low
+            if rng[1] > upp + atol:
+                rng[1] = (rng[1] - low) % span + low
 
         # get the coordinates
         coords = eval(f"self.get_{domain}('{convention}')")
@@ -1143,7 +1143,7 @@ class Coordinates():
 
     def _encode(self):
         """Return dictionary for the encoding."""
-        return self.copy().__dict__
+        return self.__dict__.copy()
 
     @classmethod
     def _decode(cls, obj_dict):
@@ -1645,12 +1645,9 @@ class Coordinates():
 
     def __array__(self):
         """Instances of Coordinates behave like `numpy.ndarray`, array_like."""
-        # make the new system
-        new_system = self._make_system('cart', convention='right', unit='met')
-        if self._system == new_system:
-            return self.get_cart()
-        # copy to avoid changing the coordinate system of the original object
-        return self.copy().get_cart()
+        # get_cart does not change the coordinate system of the object if
+        # convert=False. Hence, no copy of the entire object is required
+        return self.get_cart(convert=False)
 
     def __repr__(self):
         """Get info about Coordinates object."""
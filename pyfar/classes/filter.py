@@ -272,7 +272,7 @@ class Filter(object):
 
     def _encode(self):
         """Return dictionary for the encoding."""
-        return self.copy().__dict__
+        return self.__dict__.copy()
 
     @classmethod
     def _decode(cls, obj_dict):
@@ -1716,21 +1716,21 @@ def decibel(signal, domain='freq', log_prefix=None, log_reference=1,
             log_prefix = 20
     if domain == 'freq':
         if isinstance(signal, (pyfar.FrequencyData, pyfar.Signal)):
-            data = signal.freq.copy()
+            data = np.abs(signal.freq)
         else:
             raise ValueError(
                 f"Domain is '{domain}' and signal is type '{signal.__class__}'"
                 " but must be of type 'Signal' or 'FrequencyData'.")
     elif domain == 'time':
         if isinstance(signal, (pyfar.TimeData, pyfar.Signal)):
-            data = signal.time.copy()
+            data = np.abs(signal.time)
         else:
             raise ValueError(
                 f"Domain is '{domain}' and signal is type '{signal.__class__}'"
                 " but must be of type 'Signal' or 'TimeData'.")
     elif domain == 'freq_raw':
         if isinstance(signal, (pyfar.Signal)):
-            data = signal.freq_raw.copy()
+            data = np.abs(signal.freq_raw)
         else:
             raise ValueError(
                 f"Domain is '{domain}' and signal is type '{signal.__class__}'"
@@ -1739,11 +1739,15 @@ def decibel(signal, domain='freq', log_prefix=None, log_reference=1,
         raise ValueError(
             f"Domain is '{domain}', but has to be 'time', 'freq',"
             " or 'freq_raw'.")
+    # data is a new array and can be processed in place
     data[data == 0] = np.finfo(float).eps
+    data /= log_reference
+    np.log10(data, out=data)
+    data *= log_prefix
     if return_prefix is True:
-        return log_prefix * np.log10(np.abs(data) / log_reference), log_prefix
+        return data, log_prefix
     else:
-        return log_prefix * np.log10(np.abs(data) / log_reference)
+        return data
 
 
 def energy(signal):
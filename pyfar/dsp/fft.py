@@ -229,11 +229,6 @@ def normalization(spec, n_samples, sampling_rate, fft_norm='none',
         else:
             # Equation 12 in Ahrens et al. 2020
             norm /= np.sum(window)**2
-        # the phase is kept for being able to switch between normalizations
-        # altoug the power spectrum does usually not have phase information,
-        # i.e., spec = np.abs(spec)**2
-        if not inverse:
-            spec *= np.abs(spec)
     elif fft_norm == 'psd':
         if window is None:
             # Equation 6 in Ahrens et al. 2020
@@ -241,11 +236,6 @@ def normalization(spec, n_samples, sampling_rate, fft_norm='none',
         else:
             # Equation 13 in Ahrens et al. 2020
             norm /= (np.sum(window)**2 * sampling_rate)
-        # the phase is kept for being able to switch between normalizations
-        # altoug the power spectrum does usually not have phase information,
-        # i.e., spec = np.abs(spec)**2
-        if not inverse:
-            spec *= np.abs(spec)
     elif fft_norm != 'unitary':
         raise ValueError(("norm type must be 'unitary', 'amplitude', 'rms', "
                           f"'power', or 'psd' but is '{fft_norm}'"))
@@ -254,24 +244,33 @@ def normalization(spec, n_samples, sampling_rate, fft_norm='none',
     if inverse:
         norm = 1 / norm
 
-    # apply normalization
-    spec = spec * norm
-
     # scaling for single sided spectrum, i.e., to account for the lost
     # energy in the discarded half of the spectrum. Only the bins at 0 Hz
     # and Nyquist remain as they are (Equation 8 in Ahrens et al. 2020).
+    # The scaling is applied to the normalization factors instead of the
+    # spectrum to avoid an additional pass over the data.
     if single_sided:
         scale = 2 if not inverse else 1 / 2
         if _is_odd(n_samples):
-            spec[..., 1:] *= scale
+            norm[1:] *= scale
         else:
-            spec[..., 1:-1] *= scale
+            norm[1:-1] *= scale
 
-    # reverse the squaring in case of 'power' and 'psd' normalization
-    if inverse and fft_norm in ["power", "psd"]:
-        spec /= np.sqrt(np.abs(spec))
+    # apply normalization. This creates a new array that is processed in
+    # place in the following and the input spectrum remains unchanged.
+    normalized = spec * norm
 
-    return spec
+    if fft_norm in ["power", "psd"]:
+        # the phase is kept for being able to switch between normalizations
+        # altoug the power spectrum does usually not have phase information,
+        # i.e., spec = np.abs(spec)**2
+        if not inverse:
+            normalized *= np.abs(spec)
+        # reverse the squaring in case of inverse normalization
+        else:
+            normalized /= np.sqrt(np.abs(normalized))
+
+    return normalized
 
 
 def _is_odd(num):
@@ -475,7 +475,7 @@ class GammatoneBands():
 
     def _encode(self):
         # get dictionary representation
-        obj_dict = self.copy().__dict__
+        obj_dict = self.__dict__.copy()
         # define required data
         keep = ["_freq_range", "_resolution", "_reference_frequency",
                 "_delay", "_sampling_rate", "_state"]
@@ -47,12 +47,10 @@ representation containing all required class variables. In the simplest case
 this is
 
     def _encode(self):
-        return self.copy().__dict__
+        return self.__dict__.copy()
 
-and requires the class method ``copy``
-
-    def copy(self):
-        return copy.deepcopy(self)
+The dictionary is not modified during encoding. A shallow copy is thus
+sufficient and the object does not need to be deep copied.
 
 In some cases not all data of an object must be written to the dict during
 encoding. See pyfar.dsp.filter.GammatoneBands for an example of removing
@@ -131,7 +129,6 @@ Names, Type Hints and Zippath
 
 """
 
-import io
 import sys
 import json
 import numpy as np
@@ -154,7 +151,7 @@ def _decode(obj, zipfile):
     if isinstance(obj, dict):
         for key in obj.keys():
             _inner_decode(obj, key, zipfile)
-    elif any([isinstance(obj, x) for x in [list, tuple, set, frozenset]]):
+    elif isinstance(obj, (list, tuple, set, frozenset)):
         for i in range(0, len(obj)):
             _inner_decode(obj, i, zipfile)
 
@@ -181,25 +178,30 @@ def _inner_decode(obj, key, zipfile):
     zipfile: zipfile
     """
     if not _is_type_hint(obj[key]):
-        _decode(obj[key], zipfile)
-    elif _is_pyfar_type(obj[key][0][1:]):
-        PyfarType = _str_to_type(obj[key][0][1:])
-        obj[key] = PyfarType._decode(obj[key][1])
+        if isinstance(obj[key], (dict, list)):
+            _decode(obj[key], zipfile)
+        return
+
+    # the type hint without the leading '$' and the encoded value
+    hint, value = obj[key][0][1:], obj[key][1]
+    if hint == 'ndarray':
+        obj[key] = _decode_ndarray(value, zipfile)
+    elif _is_pyfar_type(hint):
+        PyfarType = _str_to_type(hint)
+        obj[key] = PyfarType._decode(value)
         _decode(obj[key].__dict__, zipfile)
-    elif obj[key][0][1:] == 'dtype':
-        obj[key] = getattr(np, obj[key][1])
-    elif obj[key][0][1:] == 'ndarray':
-        obj[key] = _decode_ndarray(obj[key][1], zipfile)
-    elif obj[key][0][1:] == 'complex':
-        obj[key] = complex(obj[key][1][0], obj[key][1][1])
-    elif obj[key][0][1:] == 'tuple':
-        obj[key] = tuple(obj[key][1])
-    elif obj[key][0][1:] == 'set':
-        obj[key] = set(tuple(obj[key][1]))
-    elif obj[key][0][1:] == 'frozenset':
-        obj[key] = frozenset(tuple(obj[key][1]))
-    elif obj[key][0][1:] == 'bytes':
-        obj[key] = bytes.fromhex(obj[key][1])
+    elif hint == 'dtype':
+        obj[key] = getattr(np, value)
+    elif hint == 'complex':
+        obj[key] = complex(value[0], value[1])
+    elif hint == 'tuple':
+        obj[key] = tuple(value)
+    elif hint == 'set':
+        obj[key] = set(tuple(value))
+    elif hint == 'frozenset':
+        obj[key] = frozenset(tuple(value))
+    elif hint == 'bytes':
+        obj[key] = bytes.fromhex(value)
     else:
         _decode_numpy_scalar(obj, key)
 
@@ -218,14 +220,12 @@ def _decode_numpy_scalar(obj, key):
 
 def _decode_ndarray(obj, zipfile):
     """ This function is exclusively used by `io._inner_decode` and
-    decodes `numpy.ndarrays` from a memfile.
+    decodes `numpy.ndarrays` from the zipfile.
     """
-    # Numpy.load is applied on a memory file instead of a physical file
-    memfile = io.BytesIO()
-    nd_bytes = zipfile.read(obj)
-    memfile.write(nd_bytes)
-    memfile.seek(0)
-    return np.load(memfile, allow_pickle=False)
+    # Numpy.load reads directly from the zip entry to avoid intermediate
+    # copies of the array data
+    with zipfile.open(obj) as npy_file:
+        return np.load(npy_file, allow_pickle=False)
 
 
 def _decode_object_json_aided(name, type_hint, zipfile):
@@ -279,18 +279,23 @@ def _encode(obj, zip_path, zipfile):
             or
         (2) A pair of ndarray-hint and reference/zip_path:
             [str, str] e.g. ['ndarray', 'my_coordinates/_points']
+
+    Note
+    ----
+    * The input is not modified. Dicts and lists are encoded into new
+      containers, which makes it unnecessary to copy objects before encoding.
     """
     if isinstance(obj, dict):
-        for key in obj.keys():
-            _inner_encode(obj, key, f'{zip_path}/{key}', zipfile)
-    elif isinstance(obj, (list, tuple, set, frozenset)):
-        for i in range(0, len(obj)):
-            _inner_encode(obj, i, f'{zip_path}/{i}', zipfile)
+        return {key: _inner_encode(value, f'{zip_path}/{key}', zipfile)
+                for key, value in obj.items()}
+    elif isinstance(obj, list):
+        return [_inner_encode(value, f'{zip_path}/{i}', zipfile)
+                for i, value in enumerate(obj)]
 
     return obj
 
 
-def _inner_encode(obj, key, zip_path, zipfile):
+def _inner_encode(obj, zip_path, zipfile):
     """
     This function is exclusively used by `_codec._encode` and casts the obj
     in case it is not JSON-serializable into a proper format for the zipfile
@@ -302,38 +307,40 @@ def _inner_encode(obj, key, zip_path, zipfile):
 
     Parameters
     ----------
-    obj : PyFar-object.
-
-    key :  str or int
-        The key provided by the dict or list over which currently is being
-        iterated.
+    obj : any
+        The value of the dict or list over which currently is being iterated.
 
     zip_path: str
         The potential zip path looped through all recursions.
 
     zipfile: zipfile
+
+    Returns
+    -------
+    obj : any
+        The encoded value.
     """
-    if _is_dtype(obj[key]):
-        obj[key] = ['$dtype', obj[key].__name__]
-    elif isinstance(obj[key], np.ndarray):
-        zipfile.writestr(zip_path, _encode_ndarray(obj[key]))
-        obj[key] = ['$ndarray', zip_path]
-    elif _is_pyfar_type(obj[key]):
-        obj[key] = [f'${type(obj[key]).__name__}', obj[key]._encode()]
-        _encode(obj[key][1], zip_path, zipfile)
-    elif _is_numpy_scalar(obj[key]):
-        obj[key] = [f'${type(obj[key]).__name__}', obj[key].item()]
-    elif isinstance(obj[key], complex):
-        obj[key] = ['$complex', [obj[key].real, obj[key].imag]]
-    elif isinstance(obj[key], (tuple, set, frozenset)):
-        obj[key] = [f'${type(obj[key]).__name__ }', list(obj[key])]
-    elif isinstance(obj[key], bytes):
-        obj[key] = [f'${type(obj[key]).__name__ }', obj[key].hex()]
+    if _is_dtype(obj):
+        return ['$dtype', obj.__name__]
+    elif isinstance(obj, np.ndarray):
+        _encode_ndarray(obj, zip_path, zipfile)
+        return ['$ndarray', zip_path]
+    elif _is_pyfar_type(obj):
+        return [f'${type(obj).__name__}',
+                _encode(obj._encode(), zip_path, zipfile)]
+    elif _is_numpy_scalar(obj):
+        return [f'${type(obj).__name__}', obj.item()]
+    elif isinstance(obj, complex):
+        return ['$complex', [obj.real, obj.imag]]
+    elif isinstance(obj, (tuple, set, frozenset)):
+        return [f'${type(obj).__name__ }', list(obj)]
+    elif isinstance(obj, bytes):
+        return [f'${type(obj).__name__ }', obj.hex()]
     else:
-        _encode(obj[key], zip_path, zipfile)
+        return _encode(obj, zip_path, zipfile)
 
 
-def _encode_ndarray(ndarray):
+def _encode_ndarray(ndarray, zip_path, zipfile):
     """
     The encoding of objects that are composed of primitive and numpy types
     utilizes `obj.__dict__()` and numpy encoding methods.
@@ -342,20 +349,21 @@ def _encode_ndarray(ndarray):
     ----------
     ndarray: numpy.array.
 
-    Returns
-    -------
-    bytes.
-        They bytes that where written by `numpy.save` into a memfile.
+    zip_path: str
+        The path of the entry in the zipfile.
+
+    zipfile: zipfile
+        The zipfile where the array is written to.
 
     Note
     ----
     * Do not allow pickling. It is not safe!
     """
-    # `Numpy.save` is applied on a memory file instead of a physical file
-    memfile = io.BytesIO()
-    np.save(memfile, ndarray, allow_pickle=False)
-    memfile.seek(0)
-    return memfile.read()
+    # `Numpy.save` writes directly into the zip entry to avoid copying the
+    # array data into a memory file first. The size of the entry is not known
+    # in advance and ZIP64 is required for entries larger than 2 GiB.
+    with zipfile.open(zip_path, 'w', force_zip64=True) as npy_file:
+        np.save(npy_file, ndarray, allow_pickle=False)
 
 
 def _encode_object_json_aided(obj, name, zipfile):
@@ -491,7 +499,7 @@ class BuiltinsWrapper(dict):
         return deepcopy(self)
 
     def _encode(self):
-        return self.copy()
+        return self
 
     @staticmethod
     def _decode(obj_dict):
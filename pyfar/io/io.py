@@ -166,42 +166,35 @@ def convert_sofa(sofa):
         raise ValueError(
             f"DataType {sofa.GLOBAL_DataType} is not supported.")
 
-    # Source
-    s_values = sofa.SourcePosition
-    s_domain, s_convention, s_unit = _sofa_pos(sofa.SourcePosition_Type)
-    source_coordinates = Coordinates(
-        s_values[:, 0],
-        s_values[:, 1],
-        s_values[:, 2],
-        domain=s_domain,
-        convention=s_convention,
-        unit=s_unit)
-    # Receiver
-    r_values = sofa.ReceiverPosition
-    r_domain, r_convention, r_unit = _sofa_pos(sofa.ReceiverPosition_Type)
-    receiver_coordinates = Coordinates(
-        r_values[:, 0],
-        r_values[:, 1],
-        r_values[:, 2],
-        domain=r_domain,
-        convention=r_convention,
-        unit=r_unit)
+    # Source and receiver positions
+    source_coordinates = _sofa_coordinates(
+        sofa.SourcePosition, sofa.SourcePosition_Type)
+    receiver_coordinates = _sofa_coordinates(
+        sofa.ReceiverPosition, sofa.ReceiverPosition_Type)
 
     return signal, source_coordinates, receiver_coordinates
 
 
+def _sofa_coordinates(values, pos_type):
+    """Convert positions of shape (M, 3) from a SOFA object to Coordinates."""
+    domain, convention, unit = _sofa_pos(pos_type)
+    # the columns are passed as views into the position array
+    return Coordinates(
+        values[:, 0], values[:, 1], values[:, 2],
+        domain=domain, convention=convention, unit=unit)
+
+
+# domain, convention, and unit of the Coordinates for SOFA position types
+_SOFA_POSITION_TYPES = {
+    'spherical': ('sph', 'top_elev', 'deg'),
+    'cartesian': ('cart', 'right', 'met')}
+
+
 def _sofa_pos(pos_type):
-    if pos_type == 'spherical':
-        domain = 'sph'
-        convention = 'top_elev'
-        unit = 'deg'
-    elif pos_type == 'cartesian':
-        domain = 'cart'
-        convention = 'right'
-        unit = 'met'
-    else:
-        raise ValueError("Position:Type {pos_type} is not supported.")
-    return domain, convention, unit
+    try:
+        return _SOFA_POSITION_TYPES[pos_type]
+    except KeyError:
+        raise ValueError(f"Position:Type {pos_type} is not supported.")
 
 
 def read(filename):
@@ -231,29 +224,28 @@ def read(filename):
     filename = pathlib.Path(filename).with_suffix('.far')
 
     collection = {}
-    with open(filename, 'rb') as f:
-        zip_buffer = io.BytesIO()
-        zip_buffer.write(f.read())
-        with zipfile.ZipFile(zip_buffer) as zip_file:
-            zip_paths = zip_file.namelist()
-            obj_names_hints = [
-                path.split('/')[:2] for path in zip_paths if '/$' in path]
-            for name, hint in obj_names_hints:
-                if codec._is_pyfar_type(hint[1:]):
-                    obj = codec._decode_object_json_aided(name, hint, zip_file)
-                elif hint == '$ndarray':
-                    obj = codec._decode_ndarray(f'{name}/{hint}', zip_file)
-                else:
-                    raise TypeError(
-                        '.far-file contains unknown types.'
-                        'This might occur when writing and reading files with'
-                        'different versions of Pyfar.')
-                collection[name] = obj
+    # open the archive directly to read only the required entries instead of
+    # loading the entire file into memory first
+    with zipfile.ZipFile(filename) as zip_file:
+        zip_paths = zip_file.namelist()
+        obj_names_hints = [
+            path.split('/')[:2] for path in zip_paths if '/$' in path]
+        for name, hint in obj_names_hints:
+            if codec._is_pyfar_type(hint[1:]):
+                obj = codec._decode_object_json_aided(name, hint, zip_file)
+            elif hint == '$ndarray':
+                obj = codec._decode_ndarray(f'{name}/{hint}', zip_file)
+            else:
+                raise TypeError(
+                    '.far-file contains unknown types.'
+                    'This might occur when writing and reading files with'
+                    'different versions of Pyfar.')
+            collection[name] = obj
 
-        if 'builtin_wrapper' in collection:
-            for key, value in collection['builtin_wrapper'].items():
-                collection[key] = value
-            collection.pop('builtin_wrapper')
+    if 'builtin_wrapper' in collection:
+        for key, value in collection['builtin_wrapper'].items():
+            collection[key] = value
+        collection.pop('builtin_wrapper')
 
     return collection
 
@@ -293,7 +285,7 @@ def write(filename, compress=False, **objs):
     """
     # Check for .far file extension
     filename = pathlib.Path(filename).with_suffix('.far')
-    compression = zipfile.ZIP_STORED if compress else zipfile.ZIP_DEFLATED
+    compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
     zip_buffer = io.BytesIO()
     builtin_wrapper = codec.BuiltinsWrapper()
     with zipfile.ZipFile(zip_buffer, "a", compression) as zip_file:
@@ -404,32 +396,32 @@ def write_audio(signal, filename, subtype=None, overwrite=True, **kwargs):
         warnings.warn(soundfile_warning)
         return
 
+    # Check if file exists and for overwrite before processing the data
+    if overwrite is False and os.path.isfile(filename):
+        raise FileExistsError(
+            "File already exists,"
+            "use overwrite option to disable error.")
+
     sampling_rate = signal.sampling_rate
     data = signal.time
 
     # Reshape to 2D
-    data = data.reshape(-1, data.shape[-1])
-    if len(signal.cshape) != 1:
+    if data.ndim > 2:
+        data = data.reshape(-1, data.shape[-1])
         warnings.warn(f"Signal flattened to {data.shape[0]} channels.")
 
-    # Check if file exists and for overwrite
-    if overwrite is False and os.path.isfile(filename):
-        raise FileExistsError(
-            "File already exists,"
-            "use overwrite option to disable error.")
-    else:
-        # Only the subtypes FLOAT, DOUBLE, VORBIS are not clipped,
-        # see _clipped_audio_subtypes()
-        format = pathlib.Path(filename).suffix[1:]
-        if subtype is None:
-            subtype = default_audio_subtype(format)
-        if (np.any(data > 1.) and
-                subtype.upper() not in ['FLOAT', 'DOUBLE', 'VORBIS']):
-            warnings.warn(
-                f'{format}-files of subtype {subtype} are clipped to +/- 1.')
-        soundfile.write(
-            file=filename, data=data.T, samplerate=sampling_rate,
-            subtype=subtype, **kwargs)
+    # Only the subtypes FLOAT, DOUBLE, VORBIS are not clipped,
+    # see _clipped_audio_subtypes()
+    format = pathlib.Path(filename).suffix[1:]
+    if subtype is None:
+        subtype = default_audio_subtype(format)
+    if (np.any(data > 1.) and
+            subtype.upper() not in ['FLOAT', 'DOUBLE', 'VORBIS']):
+        warnings.warn(
+            f'{format}-files of subtype {subtype} are clipped to +/- 1.')
+    soundfile.write(
+        file=filename, data=data.T, samplerate=sampling_rate,
+        subtype=subtype, **kwargs)
 
 
 def audio_formats():
@@ -47,14 +47,30 @@ be done this way
 >>> ax[0].interaction.select_action(EventEmu('Y'))
 
 """
+import os
 import numpy as np
 import matplotlib as mpl
 import matplotlib.pyplot as plt
+import pyfar.dsp as dsp
 from pyfar.plot import utils
 from pyfar.plot import _line
 from pyfar.plot import _two_d
 from pyfar.plot import _utils
 
+# names of the controls that move or zoom the x-axis, y-axis, and color map
+_MOVE_AND_ZOOM_X = frozenset(
+    {"move_left", "move_right", "zoom_x_in", "zoom_x_out"})
+_MOVE_AND_ZOOM_Y = frozenset(
+    {"move_up", "move_down", "zoom_y_in", "zoom_y_out"})
+_MOVE_AND_ZOOM_CM = frozenset(
+    {"move_cm_up", "move_cm_down", "zoom_cm_in", "zoom_cm_out"})
+# names of the controls that move up/right or zoom in
+_INCREASE = frozenset({
+    "move_right", "zoom_x_in", "move_up", "zoom_y_in", "move_cm_up",
+    "zoom_cm_in"})
+# names of the controls that cycle channels
+_CYCLE = frozenset({"next", "prev"})
+
 
 class Cycle(object):
     """ Cycle class implementation inspired by itertools.cycle. Supports
@@ -69,25 +85,19 @@ class Cycle(object):
         index : int, optional
             index of the current channel. The default is 0
         """
-        self._n_channels = np.prod(cshape)
-        self._index = index
-
-        self._channels = []
-        for index in np.ndindex(cshape):
-            self._channels.append(index)
+        self._channels = list(np.ndindex(cshape))
+        self._n_channels = len(self._channels)
+        self._index = int(index)
 
     def increase_index(self):
-        self._index = (self.index + 1) % self.n_channels
+        self._index = (self._index + 1) % self._n_channels
 
     def decrease_index(self):
-        index = self.index - 1
-        if index < 0:
-            index = self.n_channels + index
-        self._index = index
+        self._index = (self._index - 1) % self._n_channels
 
     @property
     def index(self):
-        return int(self._index)
+        return self._index
 
     @property
     def n_channels(self):
@@ -296,7 +306,6 @@ class PlotParameter(object):
             self._x_id = self._x_values.index(getattr(self, self._x_param))
             # y-axis
             self._y_type = ['other', 'other', 'other']
-            self._y_id = 0
             self._y_param = 'unwrap'
             self._y_values = [True, False, "360"]
             self._y_id = self._y_values.index(getattr(self, self._y_param))
@@ -319,7 +328,6 @@ class PlotParameter(object):
             self._y_id = self._y_values.index(getattr(self, self._y_param))
             # color map
             self._cm_type = ['other', 'other', 'other']
-            self._cm_id = 0
             self._cm_param = 'unwrap'
             self._cm_values = [True, False, "360"]
             self._cm_id = self._cm_values.index(getattr(self, self._cm_param))
@@ -540,6 +548,13 @@ class Interaction(object):
         self.all_bars = colorbars
         self.figure = self.ax.figure
         self.style = style
+        # resolve the plot style once. This avoids parsing the style file
+        # every time the plot is redrawn
+        self._style_params = utils.plotstyle(style)
+        if isinstance(self._style_params, str) \
+                and os.path.isfile(self._style_params):
+            self._style_params = dict(mpl.rc_params_from_file(
+                self._style_params, use_default_template=False))
         self.params = plot_parameter
         if self.params.plot_type == "line":
             self.kwargs_line = kwargs
@@ -553,6 +568,10 @@ class Interaction(object):
 
         # initialize cycler
         self.cycler = Cycle(self.cshape)
+        # single channel signals and their spectrograms for cycling signals
+        # (see self.channel_signal and self.channel_spectrogram)
+        self._channel_signals = {}
+        self._channel_spectrograms = {}
 
         # initialize visibility
         self.all_visible = True
@@ -560,6 +579,18 @@ class Interaction(object):
         # set initial value for text object showing the channel number
         self.txt = None
 
+        # True if a redraw was requested but the figure was not yet drawn.
+        # Used to skip replotting if keys are pressed faster than the figure
+        # is drawn (see self.cycle_signals)
+        self._draw_pending = False
+        self._replot_pending = False
+
+        # cached axes background for blitting (see self.blit_canvas)
+        self._background = None
+        self._background_bbox = None
+        # True while the background is drawn for caching (see self.on_draw)
+        self._caching = False
+
         # get keyboard shortcuts
         self.keys = utils.shortcuts(False)
         # get control shortcuts (we don't need the 'info' field here)
@@ -570,6 +601,17 @@ class Interaction(object):
         self.plot = self.keys["plots"]
         for plot in self.plot:
             self.plot[plot] = self.plot[plot]["key"]
+        # map each key to the name of the plot or control it triggers. This
+        # is used for dispatching key events in self.select_action
+        self.actions = {}
+        self.plot_names = {}
+        for plot in self.plot:
+            for key in self.plot[plot]:
+                self.actions[key] = "toggle_plot"
+                self.plot_names[key] = plot
+        for ctr in self.ctr:
+            for key in self.ctr[ctr]:
+                self.actions[key] = ctr
 
         # connect to Matplotlib
         self.connect()
@@ -584,28 +626,22 @@ class Interaction(object):
             class that contains the action, e.g., the pressed key as a string
         """
 
-        ctr = self.ctr
         self.event = event
+        action = self.actions.get(event.key)
 
         # toggle plot
-        toggle_plot = False
-        for plot in self.plot:
-            if event.key in self.plot[plot]:
-                toggle_plot = True
-                break
-
-        if toggle_plot:
+        if action == "toggle_plot":
 
             self.toggle_plot(event)
 
         # toggle plot type
-        elif event.key in ctr["cycle_plot_types"]:
+        elif action == "cycle_plot_types":
 
             # no toggling for spectrogram
             if self.params._plot == "spectrogram":
                 return
             # no toggling if signal has less than 2 channels
-            if np.prod(self.signal.cshape) < 2 \
+            if self.cycler.n_channels < 2 \
                     and self.params.plot_type == "line":
                 return
 
@@ -616,7 +652,7 @@ class Interaction(object):
             self.toggle_plot(event_emu)
 
         # toggle orientation
-        elif event.key in ctr["toggle_orientation"] \
+        elif action == "toggle_orientation" \
                 and self.params.plot_type == "2d":
 
             # toggle the orientation
@@ -626,46 +662,43 @@ class Interaction(object):
             self.toggle_plot(event_emu)
 
         # x-axis move/zoom
-        elif event.key in ctr["move_left"] + ctr["move_right"] + \
-                ctr["zoom_x_in"] + ctr["zoom_x_out"]:
+        elif action in _MOVE_AND_ZOOM_X:
             self.move_and_zoom(event, 'x')
 
         # y-axis move/zoom
-        elif event.key in ctr["move_up"] + ctr["move_down"] + \
-                ctr["zoom_y_in"] + ctr["zoom_y_out"]:
+        elif action in _MOVE_AND_ZOOM_Y:
             self.move_and_zoom(event, 'y')
 
         # color map move/zoom
-        elif event.key in ctr["move_cm_up"] + ctr["move_cm_down"] + \
-                ctr["zoom_cm_in"] + ctr["zoom_cm_out"]:
+        elif action in _MOVE_AND_ZOOM_CM:
             self.move_and_zoom(event, 'cm')
 
         # x-axis toggle
-        elif event.key in ctr["toggle_x"]:
+        elif action == "toggle_x":
             changed = self.params.toggle_x()
             if changed:
                 self.toggle_plot(EventEmu(self.plot[self.params._plot]))
 
         # y-axis toggle
-        elif event.key in ctr["toggle_y"]:
+        elif action == "toggle_y":
             changed = self.params.toggle_y()
             if changed:
                 self.toggle_plot(EventEmu(self.plot[self.params._plot]))
 
         # color map toggle
-        elif event.key in ctr["toggle_cm"]:
+        elif action == "toggle_cm":
             changed = self.params.toggle_colormap()
             if changed:
                 self.toggle_plot(EventEmu(self.plot[self.params._plot]))
 
         # toggle line visibility
-        elif event.key in ctr["toggle_all"]:
+        elif action == "toggle_all":
             if self.params._cycler_type == 'line' \
                     and self.cycler.n_channels > 1:
                 self.toggle_all_lines()
 
         # cycle channels
-        elif event.key in ctr["next"] + ctr["prev"]:
+        elif action in _CYCLE:
             if self.cycler.n_channels > 1:
                 self.cycle(event)
 
@@ -678,17 +711,20 @@ class Interaction(object):
     def toggle_plot(self, event):
         """Toggle between plot types."""
 
-        plot = self.plot
         prm = self.params
+        plot = self.plot_names.get(event.key)
 
         # cases that are not allowed
+        # unknown plot
+        if plot is None:
+            return
         # spectogram plot if signal has less samples than the window length
-        if event.key in plot['spectrogram'] \
+        if plot == 'spectrogram' \
                 and self.signal.n_samples < prm.window_length:
             return
 
         # prepare for toggling
-        with plt.style.context(utils.plotstyle(self.style)):
+        with plt.style.context(self._style_params):
             self.figure.clear()
             # This saves the axis used for interaction
             self.ax = None
@@ -702,7 +738,7 @@ class Interaction(object):
             # 3. update self.params (PlotParameter instance)
             # 4. plot and update all current axes and colorbars (None by
             #    default) and self.ax (axes used for interaction)
-            if event.key in plot['time']:
+            if plot == 'time':
                 if self.params.plot_type == "line":
                     self.params.update('time')
                     self.all_axes = self.ax = _line._time(
@@ -718,7 +754,7 @@ class Interaction(object):
                         self.ax, **self.kwargs_2d)
                     self.ax = self.all_axes
 
-            elif event.key in plot['freq']:
+            elif plot == 'freq':
                 if self.params.plot_type == "line":
                     self.params.update('freq')
                     self.all_axes = self.ax = _line._freq(
@@ -734,7 +770,7 @@ class Interaction(object):
                         self.ax, **self.kwargs_2d)
                     self.ax = self.all_axes
 
-            elif event.key in plot['phase']:
+            elif plot == 'phase':
                 if self.params.plot_type == "line":
                     self.params.update('phase')
                     self.all_axes = self.ax = _line._phase(
@@ -748,7 +784,7 @@ class Interaction(object):
                         prm.colorbar, self.ax, **self.kwargs_2d)
                     self.ax = self.all_axes
 
-            elif event.key in plot['group_delay']:
+            elif plot == 'group_delay':
                 if self.params.plot_type == "line":
                     self.params.update('group_delay')
                     self.all_axes = self.ax = _line._group_delay(
@@ -762,17 +798,18 @@ class Interaction(object):
                         self.ax, **self.kwargs_2d)
                     self.ax = self.all_axes
 
-            elif event.key in plot['spectrogram']:
+            elif plot == 'spectrogram':
                 self.params.update('spectrogram')
                 self.all_axes, _, self.all_bars = _two_d._spectrogram(
-                    self.signal[self.cycler.index], prm.dB_freq,
+                    self.channel_signal(self.cycler.index), prm.dB_freq,
                     prm.log_prefix_freq, prm.log_reference, prm.yscale,
                     prm.unit_time, prm.window, prm.window_length,
                     prm.window_overlap_fct, prm.colorbar, self.ax,
+                    self.channel_spectrogram(self.cycler.index),
                     **self.kwargs_2d)
                 self.ax = self.all_axes
 
-            elif event.key in plot['time_freq']:
+            elif plot == 'time_freq':
                 if self.params.plot_type == "line":
                     self.params.update('time_freq')
                     self.all_axes = _line._time_freq(
@@ -791,7 +828,7 @@ class Interaction(object):
                         prm.colorbar, self.ax, **self.kwargs_2d)
                     self.ax = self.all_axes[0]
 
-            elif event.key in plot['freq_phase']:
+            elif plot == 'freq_phase':
                 if self.params.plot_type == "line":
                     self.params.update('freq_phase')
                     self.all_axes = _line._freq_phase(
@@ -808,7 +845,7 @@ class Interaction(object):
                         prm.colorbar, self.ax, **self.kwargs_2d)
                     self.ax = self.all_axes[0]
 
-            elif event.key in plot['freq_group_delay']:
+            elif plot == 'freq_group_delay':
                 if self.params.plot_type == "line":
                     self.params.update('freq_group_delay')
                     self.all_axes = _line._freq_group_delay(
@@ -837,91 +874,59 @@ class Interaction(object):
 
     def move_and_zoom(self, event, axis):
         """
-        Get parameters for moving/zoom and call apply_move_and_zoom().
-        See apply_move_and_zoom for more parameter description.
-        """
-
-        ctr = self.ctr
-        getter = None
-
-        # move/zoom x-axis
-        if axis == "x":
-
-            if self.params.x_type is None:
-                return
-
-            getter = self.ax.get_xlim
-            setter = self.ax.set_xlim
-            axis_type = self.params.x_type
-            if event.key in ctr["move_left"] + ctr["move_right"]:
-                operation = "move"
-            else:
-                operation = "zoom"
-            if event.key in ctr["move_right"] + ctr["zoom_x_in"]:
-                direction = "increase"
-            else:
-                direction = "decrease"
-
-        # move/zoom y-axis
-        elif axis == "y":
-
-            if self.params.y_type is None:
-                return
+        Move or zoom the x-axis, y-axis, or colormap.
 
-            getter = self.ax.get_ylim
-            setter = self.ax.set_ylim
-            axis_type = self.params.y_type
-            if event.key in ctr["move_up"] + ctr["move_down"]:
-                operation = "move"
-            else:
-                operation = "zoom"
-            if event.key in ctr["move_up"] + ctr["zoom_y_in"]:
-                direction = "increase"
-            else:
-                direction = "decrease"
+        See get_new_axis_limits for more information.
 
-        # move/zoom colorbar
-        elif axis == "cm":
+        Parameters
+        ----------
+        event : mpl_connect event, EventEmu
+            The key event. Must be one of the move or zoom controls.
+        axis : 'x', 'y', 'cm'
+            The axis to be moved or zoomed.
+        """
 
-            if self.params.cm_type is None:
-                return
+        # axis type, e.g., 'freq' for the x-axis of the frequency plot
+        axis_type = getattr(self.params, f"{axis}_type")
+        if axis_type is None:
+            return
 
+        # get and set limits of the x-axis, y-axis, or colorbar
+        if axis == "cm":
             qm = _utils._get_quad_mesh_from_axis(self.ax)
-
             getter = qm.get_clim
             setter = qm.set_clim
-            axis_type = self.params.cm_type
-            if event.key in ctr["move_cm_up"] + ctr["move_cm_down"]:
-                operation = "move"
-            else:
-                operation = "zoom"
-            if event.key in ctr["move_cm_up"] + ctr["zoom_cm_in"]:
-                direction = "increase"
-            else:
-                direction = "decrease"
+        else:
+            getter = getattr(self.ax, f"get_{axis}lim")
+            setter = getattr(self.ax, f"set_{axis}lim")
 
-        if getter is not None:
-            # get the new axis limits
-            current_limits = np.asarray(getter())
-            new_limits = get_new_axis_limits(
-                current_limits, axis_type, operation, direction)
+        action = self.actions[event.key]
+        operation = "move" if action.startswith("move") else "zoom"
+        direction = "increase" if action in _INCREASE else "decrease"
 
-            # apply the new axis limits
-            setter(new_limits[0], new_limits[1])
-            self.draw_canvas()
+        # get the new axis limits
+        new_limits = get_new_axis_limits(
+            getter(), axis_type, operation, direction)
+
+        # apply the new axis limits
+        setter(new_limits[0], new_limits[1])
+        self.draw_canvas()
+
+    def set_lines_visible(self, visible):
+        """Set the visibility of all lines in the interaction axes."""
+        for line in self.ax.lines:
+            line.set_visible(visible)
 
     def toggle_all_lines(self):
         if self.all_visible:
-            for i in range(len(self.ax.lines)):
-                self.ax.lines[i].set_visible(False)
+            self.set_lines_visible(False)
             self.ax.lines[self.cycler.index].set_visible(True)
             self.all_visible = False
+            self.blit_canvas()
         else:
-            for i in range(len(self.ax.lines)):
-                self.ax.lines[i].set_visible(True)
+            self.set_lines_visible(True)
             self.all_visible = True
-
-        self.draw_canvas()
+            self.draw_canvas()
 
     def cycle(self, event):
         if self.params._cycler_type == 'line':
@@ -932,32 +937,82 @@ class Interaction(object):
     def cycle_lines(self, event):
         # set visible lines invisible
         if self.all_visible or event.key == 'redraw':
-            for i in range(len(self.ax.lines)):
-                self.ax.lines[i].set_visible(False)
+            self.set_lines_visible(False)
         else:
             self.ax.lines[self.cycler.index].set_visible(False)
 
         # cycle
-        if event.key in self.ctr["next"]:
+        action = self.actions.get(event.key)
+        if action == "next":
             self.cycler.increase_index()
-        elif event.key in self.ctr["prev"]:
+        elif action == "prev":
             self.cycler.decrease_index()
 
         # set current line visible
         self.ax.lines[self.cycler.index].set_visible(True)
         self.all_visible = False
-        self.draw_canvas()
+        if event.key == 'redraw':
+            self.draw_canvas()
+        else:
+            self.blit_canvas()
 
     def cycle_signals(self, event):
         # cycle index
-        if event.key in self.ctr["next"]:
+        action = self.actions.get(event.key)
+        if action == "next":
             self.cycler.increase_index()
-        elif event.key in self.ctr["prev"]:
+        elif action == "prev":
             self.cycler.decrease_index()
 
-        # re-plot
+        # re-plot. If the last re-plot was not drawn yet, only the most recent
+        # channel is plotted once the figure was drawn (see self.on_draw)
         self.all_visible = False
-        self.toggle_plot(EventEmu(self.plot['spectrogram']))
+        if self._draw_pending:
+            self._replot_pending = True
+        else:
+            self.toggle_plot(EventEmu(self.plot['spectrogram']))
+
+    def channel_signal(self, index):
+        """
+        Get a single channel of the signal.
+
+        Channels are cached to avoid slicing the signal again when cycling
+        back to a channel that was already shown.
+
+        Parameters
+        ----------
+        index : int
+            The index of the channel in the flattened signal.
+        """
+        if index not in self._channel_signals:
+            self._channel_signals[index] = self.signal[index]
+        return self._channel_signals[index]
+
+    def channel_spectrogram(self, index):
+        """
+        Get the spectrogram of a single channel of the signal.
+
+        Spectrograms are cached because computing them is the most expensive
+        part of re-plotting when cycling channels. The window parameters do
+        not change during interaction.
+
+        Parameters
+        ----------
+        index : int
+            The index of the channel in the flattened signal.
+
+        Returns
+        -------
+        stft : tuple
+            frequencies, times, and spectrogram as returned by
+            ``pyfar.dsp.spectrogram``.
+        """
+        if index not in self._channel_spectrograms:
+            prm = self.params
+            self._channel_spectrograms[index] = dsp.spectrogram(
+                self.channel_signal(index), prm.window, prm.window_length,
+                prm.window_overlap_fct)
+        return self._channel_spectrograms[index]
 
     def write_current_channel_text(self):
 
@@ -969,7 +1024,7 @@ class Interaction(object):
         y_pos = .02
 
         # write new text
-        with plt.style.context(utils.plotstyle(self.style)):
+        with plt.style.context(self._style_params):
             bbox = dict(boxstyle="round", fc=mpl.rcParams["axes.facecolor"],
                         ec=mpl.rcParams["axes.facecolor"], alpha=.5)
 
@@ -978,27 +1033,125 @@ class Interaction(object):
                 horizontalalignment='right', verticalalignment='baseline',
                 bbox=bbox, transform=self.ax.transAxes)
 
-            self.draw_canvas()
+        self._redraw_channel_text()
 
     def delete_current_channel_text(self):
         if self.txt is not None:
             self.txt.remove()
             self.txt = None
+            self._redraw_channel_text()
+
+    def _redraw_channel_text(self):
+        # blit only if a background is cached. Otherwise the axes changed and
+        # a full (idle) redraw is required anyways
+        if self._background is not None:
+            self.blit_canvas()
+        else:
             self.draw_canvas()
 
     def draw_canvas(self):
-        with plt.style.context(utils.plotstyle(self.style)):
-            self.figure.canvas.draw()
+        # a full redraw invalidates the background cached for blitting
+        self._background = None
+        # draw_idle coalesces multiple requests (e.g., from auto-repeated key
+        # events) into a single redraw once the GUI event loop is idle. The
+        # drawing happens later and is thus not done within a style context.
+        # The style is applied when creating the artists.
+        self._draw_pending = True
+        self.figure.canvas.draw_idle()
+
+    def on_draw(self, event):
+        """Process re-plots that were skipped while waiting for a draw."""
+        # any draw that does not cache the background might change it, e.g.,
+        # panning and zooming with the toolbar
+        if not self._caching:
+            self._background = None
+        self._draw_pending = False
+        if self._replot_pending:
+            self._replot_pending = False
+            self.toggle_plot(EventEmu(self.plot['spectrogram']))
+            self.write_current_channel_text()
+
+    def cache_background(self):
+        """
+        Cache the background of the interaction axes for blitting.
+
+        The background is everything except the artists returned by
+        self._blit_artists. It is only valid as long as the figure is not
+        drawn otherwise, e.g., after changing the axis limits. The entire
+        figure is cached because some of the artists, e.g., the spines,
+        extend beyond the axes.
+        """
+        artists = self._blit_artists()
+        visible = [artist.get_visible() for artist in artists]
+        for artist in artists:
+            artist.set_visible(False)
+
+        self._caching = True
+        try:
+            with plt.style.context(self._style_params):
+                self.figure.canvas.draw()
+        finally:
+            self._caching = False
+        self._background = self.figure.canvas.copy_from_bbox(self.figure.bbox)
+        self._background_bbox = self.figure.bbox.bounds
+
+        for artist, vis in zip(artists, visible):
+            artist.set_visible(vis)
+
+    def _blit_artists(self):
+        """
+        Return the artists that are redrawn when blitting.
+
+        These are the lines, the text showing the current channel, and all
+        artists that are drawn on top of them, e.g., the legend. They are
+        returned in the order in which Matplotlib draws them.
+        """
+        artists = self.ax.lines + ([self.txt] if self.txt is not None else [])
+        if not artists:
+            return artists
+        zorder = min(artist.get_zorder() for artist in artists)
+        artists += [artist for artist in self.ax.get_children()
+                    if artist.get_zorder() > zorder
+                    and artist not in artists and artist is not self.ax.patch]
+        return sorted(artists, key=lambda artist: artist.get_zorder())
+
+    def blit_canvas(self):
+        """
+        Redraw only the lines and the channel text of the interaction axes,
+        and all artists on top of them.
+
+        The static background is restored from a cache instead of
+        re-rendering the entire figure. A full redraw is done if the canvas
+        does not support blitting.
+        """
+        canvas = self.figure.canvas
+        if not canvas.supports_blit:
+            self.draw_canvas()
+            return
+
+        # (re-)cache the background, e.g., if the figure was resized
+        if self._background is None \
+                or self._background_bbox != self.figure.bbox.bounds:
+            self.cache_background()
+
+        canvas.restore_region(self._background)
+        for artist in self._blit_artists():
+            if artist.get_visible():
+                self.ax.draw_artist(artist)
+        canvas.blit(self.figure.bbox)
 
     def connect(self):
         """Connect to Matplotlib figure."""
         self.figure.AxisModifier = self
         self.mpl_id = self.figure.canvas.mpl_connect(
             'key_press_event', self.select_action)
+        self.mpl_draw_id = self.figure.canvas.mpl_connect(
+            'draw_event', self.on_draw)
 
     def disconnect(self):
         """Disconnect from Matplotlib figure."""
         self.figure.canvas.mpl_disconnect(self.mpl_id)
+        self.figure.canvas.mpl_disconnect(self.mpl_draw_id)
 
 
 def get_new_axis_limits(limits, axis_type, operation, direction, amount=.1):
@@ -1028,39 +1181,44 @@ def get_new_axis_limits(limits, axis_type, operation, direction, amount=.1):
         amount to move or zoom in percent. E.g., `amount=.1` will move/zoom
         10 percent of the current axis/colormap range. The default is 0.1
 
+    Returns
+    -------
+    new_limits : tuple
+        The new lower and upper axis limits.
     """
 
-    # get the amount to be shifted
-    dyn_range = np.diff(np.array(limits))
-    shift = amount * dyn_range
+    # get the amount to be shifted (plain scalar arithmetic is used because
+    # numpy is slower for computations with only two values)
+    lower, upper = limits
+    shift = amount * (upper - lower)
 
     # distribute shift to the lower and upper bound of frequency axes
     if axis_type == 'freq':
-        shift = np.array([limits[0] / limits[1] * shift,
-                         (1 - limits[0] / limits[1]) * shift]).flatten()
+        shift_lower = lower / upper * shift
+        shift_upper = (1 - lower / upper) * shift
     else:
-        shift = np.tile(shift, 2)
+        shift_lower = shift_upper = shift
+
+    # move up/right and zoom in for positive signs
+    sign = 1 if direction == 'increase' else -1
 
     if operation == 'move':
-        # reverse the sign
-        if direction == 'decrease':
-            shift *= -1
+        shift_lower = sign * shift_lower
+        shift_upper = sign * shift_upper
 
     elif operation == 'zoom':
-        # reverse one sign for zooming in/out
-        if direction == 'decrease':
-            shift[0] *= -1
-        else:
-            shift[1] *= -1
-
         # dB axes only zoom at the lower end
         if axis_type == 'dB':
-            shift = np.array([2 * shift[0], 0])
+            shift_lower = 2 * sign * shift_lower
+            shift_upper = 0
+        else:
+            shift_lower = sign * shift_lower
+            shift_upper = -sign * shift_upper
     else:
         raise ValueError(
             f"operation must be 'move' or 'zoom' but is {operation}")
 
     # get new limits
-    new_limits = limits + shift
+    new_limits = (lower + shift_lower, upper + shift_upper)
 
     return new_limits
@@ -1,3 +1,4 @@
+import math
 import numpy as np
 from pyfar import Signal, TimeData, FrequencyData
 import pyfar.dsp as dsp
@@ -9,6 +10,9 @@ from .ticker import (
     MultipleFractionLocator,
     MultipleFractionFormatter)
 
+# machine precision added before taking the logarithm of spectrograms
+_EPS = np.finfo(float).eps
+
 
 def _time_2d(signal, dB, log_prefix, log_reference, unit, indices,
              orientation, method, colorbar, ax, **kwargs):
@@ -191,7 +195,6 @@ def _group_delay_2d(signal, unit, freq_scale, indices, orientation, method,
     kwargs = _utils._return_default_colors_rgb(**kwargs)
     data = dsp.group_delay(signal)
     data = np.reshape(data, signal.freq.shape)
-    data = data.T if orientation == "vertical" else data
     # auto detect the unit
     if unit is None:
         unit = _utils._time_auto_unit(
@@ -200,6 +203,8 @@ def _group_delay_2d(signal, unit, freq_scale, indices, orientation, method,
     if unit != "samples":
         factor, unit = _utils._deal_time_units(unit)
         data = data / signal.sampling_rate * factor
+    # transpose after processing the data in its contiguous layout
+    data = data.T if orientation == "vertical" else data
 
     # setup axis label and data
     axis = [ax[0].yaxis, ax[0].xaxis]
@@ -299,7 +304,7 @@ def _freq_group_delay_2d(
 def _spectrogram(signal, dB=True, log_prefix=None, log_reference=1,
                  freq_scale='linear', unit="s", window='hann',
                  window_length=1024, window_overlap_fct=0.5,
-                 colorbar=True, ax=None, **kwargs):
+                 colorbar=True, ax=None, stft=None, **kwargs):
     """Plot the magnitude spectrum versus time.
 
     See pyfar.line.spectogram for more information.
@@ -309,6 +314,11 @@ def _spectrogram(signal, dB=True, log_prefix=None, log_reference=1,
     axes containing also the axis of the colorbar as the public function does.
     This makes  handling interactions easier. The axis of the colorbar is added
     in pyfar.line.spectrogram.
+
+    `stft` can be used to pass the tuple returned by ``dsp.spectrogram`` for
+    the first channel of `signal` with the given window parameters. This
+    avoids computing the spectrogram again, e.g., when cycling through
+    channels in interactive plots. It is computed if `stft` is ``None``.
     """
 
     # check input
@@ -321,31 +331,39 @@ def _spectrogram(signal, dB=True, log_prefix=None, log_reference=1,
     if window_length > signal.n_samples:
         raise ValueError("window_length exceeds signal length")
 
-    if np.prod(signal.cshape) > 1:
+    n_channels = math.prod(signal.cshape)
+    if n_channels > 1:
         warnings.warn(("Using only the first channel of "
-                       f"{np.prod(signal.cshape)}-channel signal."))
+                       f"{n_channels}-channel signal."))
 
     # take only the first channel of time data
-    first_channel = tuple(np.zeros(len(signal.cshape), dtype='int'))
+    first_channel = (0, ) * len(signal.cshape)
 
     # get spectrogram
-    frequencies, times, spectrogram = dsp.spectrogram(
-        signal[first_channel], window, window_length, window_overlap_fct)
+    if stft is None:
+        stft = dsp.spectrogram(
+            signal[first_channel], window, window_length, window_overlap_fct)
+    frequencies, times, spectrogram = stft
 
     # get magnitude data in dB
     if dB:
         if log_prefix is None:
             log_prefix = _utils._log_prefix(signal)
-        eps = np.finfo(float).eps
-        spectrogram = log_prefix*np.log10(
-            np.abs(spectrogram) / log_reference + eps)
+        # np.abs returns a new array that is processed in place to avoid
+        # temporary copies
+        spectrogram = np.abs(spectrogram)
+        spectrogram /= log_reference
+        spectrogram += _EPS
+        np.log10(spectrogram, out=spectrogram)
+        spectrogram *= log_prefix
 
     # auto detect the time unit
     if unit in [None, "auto"]:
         unit = _utils._time_auto_unit(times[..., -1])
     # set the unit
+    # (times must not be changed in place to keep a passed stft untouched)
     if unit == 'samples':
-        times *= signal.sampling_rate
+        times = times * signal.sampling_rate
     else:
         factor, unit = _utils._deal_time_units(unit)
         times = times * factor
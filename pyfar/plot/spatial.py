@@ -77,15 +77,19 @@ def quiver(
     origins = np.atleast_2d(origins).astype(np.float64)
     endpoints = np.atleast_2d(endpoints).astype(np.float64)
 
-    min_val = min(np.min(origins), np.min(endpoints))
-    max_val = max(np.max(origins), np.max(endpoints))
+    # combine the reductions by passing the extremum of the origins as
+    # initial value of the reduction over the endpoints
+    min_val = np.min(endpoints, initial=np.min(origins))
+    max_val = np.max(endpoints, initial=np.max(origins))
 
     # plot with plotstyle
     with pf.plot.context():
         ax = _setup_axes(
             projection, ax, set_ax, bounds=(min_val, max_val), **kwargs)
 
-        ax.quiver(*origins.T, *endpoints.T, **kwargs)
+        ax.quiver(origins[..., 0], origins[..., 1], origins[..., 2],
+                  endpoints[..., 0], endpoints[..., 1], endpoints[..., 2],
+                  **kwargs)
 
     return ax
 
@@ -136,16 +140,14 @@ def _setup_axes(projection=Axes3D.name, ax=None,
     # equal axis limits for distortion free  display
     if set_ax:
         # unfortunately ax.set_aspect('equal') does not work on Axes3D
-        ax_lims = [bounds[0]-.15*np.abs(bounds[0]),
-                   bounds[1]+.15*np.abs(bounds[1])]
+        lower = bounds[0] - .15 * abs(bounds[0])
+        upper = bounds[1] + .15 * abs(bounds[1])
         if not ax.get_autoscale_on():
-            if ax_lims[0] > ax.get_xlim()[0]:
-                ax_lims[0] = ax.get_xlim()[0]
-            if ax_lims[1] < ax.get_xlim()[1]:
-                ax_lims[1] = ax.get_xlim()[1]
-
-        ax.set_xlim(ax_lims)
-        ax.set_ylim(ax_lims)
-        ax.set_zlim(ax_lims)
+            x_lims = ax.get_xlim()
+            lower = min(lower, x_lims[0])
+            upper = max(upper, x_lims[1])
+
+        for set_lim in (ax.set_xlim, ax.set_ylim, ax.set_zlim):
+            set_lim(lower, upper)
 
     return ax
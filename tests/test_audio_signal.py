@@ -35,6 +35,9 @@ def test_signal_init_assertions():
     with pytest.raises(ValueError, match="n_samples can not be larger"):
         Signal(1, 44100, domain="freq", n_samples=10)
 
+    with pytest.raises(ValueError, match="Number of frequencies does not"):
+        Signal([1, 2, 3, 4, 5], 44100, domain="freq", n_samples=4)
+
     with pytest.raises(ValueError, match="Invalid domain"):
         Signal(1, 44100, domain="space")
 
@@ -311,6 +314,25 @@ def test_magic_getitem_allslice():
     npt.assert_allclose(signal[:]._data, time[:])
 
 
+def test_magic_getitem_view():
+    """Test if basic slicing returns a view of the data."""
+    time = np.arange(2 * 3 * 4).reshape((2, 3, 4))
+    signal = Signal(time, 44100, domain='time')
+    assert np.shares_memory(signal[0]._data, signal._data)
+    assert not np.shares_memory(signal[0].copy()._data, signal._data)
+
+
+def test_magic_getitem_freq_domain():
+    """Test slicing a signal in the frequency domain with FFT norm."""
+    time = np.arange(2 * 4).reshape((2, 4))
+    signal = Signal(time, 44100, fft_norm='rms')
+    signal.domain = 'freq'
+    item = signal[0]
+    assert item.domain == 'freq'
+    npt.assert_allclose(item.freq, signal.freq[:1])
+    npt.assert_allclose(item.time, time[:1], atol=1e-14)
+
+
 def test_magic_setitem():
     """Test the magic function __setitem__."""
     signal = Signal([1, 2, 3], 44100)
@@ -53,6 +53,42 @@ def test_add_three_signals():
     npt.assert_allclose(y.time, np.atleast_2d([3, 0, 0]), atol=1e-15)
 
 
+@pytest.mark.parametrize("domain", ['time', 'freq'])
+def test_add_result_does_not_share_memory(domain):
+    """Test if the result is independent of the input data."""
+    x = Signal([1, 0, 0], 44100)
+    y = pf.add((x, x), domain)
+    assert not np.shares_memory(x._data, y._data)
+    # single operand
+    y = pf.add((x, ), domain)
+    assert not np.shares_memory(x._data, y._data)
+    # single array operand with integer data
+    x = np.array([1, 0, 0])
+    y = pf.add((x, ), domain)
+    assert not np.shares_memory(x, y)
+
+
+def test_add_three_operands_changing_shape_and_type():
+    """Test if the result can grow in shape and type across operations."""
+    x = Signal([1, 0, 0], 44100)
+    y = Signal([[1, 0, 0], [2, 0, 0]], 44100)
+    z = pf.add((x, x, y, 1j), 'freq')
+    assert z.cshape == (2, )
+    npt.assert_allclose(
+        z.freq_raw, 2 * x.freq_raw + y.freq_raw + 1j, atol=1e-15)
+
+
+@pytest.mark.parametrize("operation,identity", [
+    (pf.add, 0), (pf.subtract, 0), (pf.multiply, 1), (pf.divide, 1),
+    (pf.power, 1)])
+def test_arithmetic_with_identity(operation, identity):
+    """Test operations with values that do not change the result."""
+    x = Signal([1, 2, 3], 44100)
+    y = operation((x, identity), 'time')
+    npt.assert_allclose(y.time, x.time, atol=1e-15)
+    assert not np.shares_memory(x._data, y._data)
+
+
 # test add Signals and number
 def test_add_signal_and_number():
     # generate and add signals
@@ -431,10 +467,15 @@ def test_assert_match_for_arithmetic():
     assert out[0] == 44100
     assert out[1] == 4
     assert out[2] == 'none'
-    assert out[-1] == (1,)
+    assert out[6] == (1,)
     out = signal._assert_match_for_arithmetic(
         (s, s4), 'time', division=False, matmul=False)
     assert out[2] == 'rms'
+    # check if array likes are converted to arrays
+    out = signal._assert_match_for_arithmetic(
+        (s, [1, 2]), 'time', division=False, matmul=False)
+    assert out[-1][0] is s
+    assert isinstance(out[-1][1], np.ndarray)
 
     # check with non-tuple input for first argument
     with raises(ValueError):
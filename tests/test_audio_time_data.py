@@ -125,6 +125,15 @@ def test_data_time_find_nearest():
     idx = time.find_nearest_time([.15, .4])
     npt.assert_allclose(idx, np.asarray([1, 2]))
 
+    # test for values outside the range of times
+    idx = time.find_nearest_time([-1, 1])
+    npt.assert_equal(idx, np.asarray([0, 2]))
+
+    # test for equally close times (the first one is returned)
+    time = TimeData(data, [0, 1, 3])
+    idx = time.find_nearest_time([.5, 2])
+    npt.assert_equal(idx, np.asarray([0, 1]))
+
 
 def test_magic_getitem_slice():
     """Test slicing operations by the magic function __getitem__."""
@@ -197,6 +206,16 @@ def test___eq___equal():
     assert time_data == actual
 
 
+def test_copy_is_independent():
+    """Check if the data and times of a copy do not share memory."""
+    time_data = TimeData([1, 2, 3], [0.1, 0.2, 0.3], comment='comment')
+    actual = time_data.copy()
+    assert isinstance(actual, TimeData)
+    assert actual.comment == 'comment'
+    assert not np.shares_memory(actual.time, time_data.time)
+    assert not np.shares_memory(actual.times, time_data.times)
+
+
 def test___eq___notEqual():
     """Check if TimeData object is equal."""
     time_data = TimeData([1, 2, 3], [0.1, 0.2, 0.3])
@@ -728,3 +728,13 @@ def test___eq___differInShComment_notEqual():
     coordinates = Coordinates(1, 2, 3, comment="Madre mia!")
     actual = Coordinates(1, 2, 3, comment="Oh my woooooosh!")
     assert not coordinates == actual
+
+
+def test___array__():
+    """Test conversion to numpy array without changing the internal system."""
+    coords = Coordinates([0, 90], 0, 1, 'sph', 'top_elev', 'deg')
+    points = np.asarray(coords)
+    npt.assert_allclose(points, [[1, 0, 0], [0, 1, 0]], atol=1e-15)
+    assert coords._system['domain'] == 'sph'
+    npt.assert_allclose(coords.get_sph('top_elev', 'deg'),
+                        [[0, 0, 1], [90, 0, 1]])
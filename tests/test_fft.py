@@ -1,6 +1,6 @@
 import numpy as np
 import numpy.testing as npt
-
+import pytest
 from pytest import raises
 
 from pyfar.dsp import fft
@@ -316,6 +316,15 @@ def test_normalization_with_window():
             npt.assert_allclose(spec, np.array([.5, 1, .5]), atol=1e-15)
 
 
+@pytest.mark.parametrize("fft_norm", ['power', 'psd'])
+@pytest.mark.parametrize("inverse", [False, True])
+def test_normalization_does_not_modify_input(fft_norm, inverse):
+    """Test if the normalization returns a new array."""
+    spec = np.array([.5, 1, .5])
+    fft.normalization(spec, 4, 44100, fft_norm, inverse=inverse)
+    npt.assert_array_equal(spec, np.array([.5, 1, .5]))
+
+
 def test_normalization_with_window_value_error():
     """
     Test if normalization throws a ValueError if the window has the
@@ -8,6 +8,7 @@ from pyfar.testing.stub_utils import stub_str_to_type, stub_is_pyfar_type
 
 import os.path
 import pathlib
+import zipfile
 import soundfile
 
 from pyfar import io
@@ -66,6 +67,12 @@ def test_read_sofa_position_type_spherical(
         sofa_reference_coordinates[1])
 
 
+def test_sofa_pos_assertion():
+    """Test error for unsupported position types."""
+    with pytest.raises(ValueError, match="Position:Type cylindrical"):
+        io.io._sofa_pos('cylindrical')
+
+
 def test_convert_sofa_assertion():
     """
     Test assertion for convert_sofa
@@ -195,6 +202,8 @@ def test_write_read_signal(domain, sine, tmpdir):
     filename = os.path.join(tmpdir, 'signal.far')
     sine.domain = domain
     io.write(filename, signal=sine)
+    # writing must not change the signal
+    assert sine.domain == domain
     actual = io.read(filename)['signal']
     assert isinstance(actual, Signal)
     # io.write encodes in domain = 'time'
@@ -224,6 +233,37 @@ def test_write_read_frequencydata(frequency_data, tmpdir):
     assert actual == frequency_data
 
 
+@pytest.mark.parametrize("audio", [
+    Signal([1, 2, 3], 44100), TimeData([1, 2, 3], [0, 1, 2]),
+    FrequencyData([1, 2, 3], [0, 1, 2])])
+def test_decode_audio_with_obsolete_attributes(audio):
+    """
+    Make sure attributes written by earlier versions are ignored when
+    decoding audio objects
+    """
+    obj_dict = audio._encode()
+    obj_dict['_VALID_DOMAINS'] = ['time', 'freq']
+    obj_dict['_VALID_FFT_NORMS'] = [
+        "none", "unitary", "amplitude", "rms", "power", "psd"]
+    actual = type(audio)._decode(obj_dict)
+    assert '_VALID_DOMAINS' not in actual.__dict__
+    assert '_VALID_FFT_NORMS' not in actual.__dict__
+    assert actual == audio
+
+
+def test_decode_signal_with_times():
+    """
+    Make sure times written by earlier versions are ignored when decoding
+    signals
+    """
+    signal = Signal([1, 2, 3], 44100)
+    obj_dict = signal._encode()
+    obj_dict['_times'] = signal.times
+    actual = Signal._decode(obj_dict)
+    assert '_times' not in actual.__dict__
+    assert actual == signal
+
+
 def test_write_read_sphericalvoronoi(sphericalvoronoi, tmpdir):
     """ SphericalVoronoi
     Make sure `read` understands the bits written by `write`
@@ -355,6 +395,20 @@ def test_write_read_builtins(dict_of_builtins, tmpdir):
     assert dict_of_builtins.items() <= actual.items()
 
 
+def test_write_does_not_modify_objects(filter, tmpdir):
+    """ Encoding works on shallow copies and must leave the written objects
+    untouched, including nested containers holding numpy arrays.
+    """
+    filename = os.path.join(tmpdir, 'unchanged.far')
+    nested_list = [np.array([1, 2, 3]), (1, 2), {'array': np.array([4, 5])}]
+    io.write(filename, filter=filter, nested_list=nested_list)
+
+    assert isinstance(nested_list[0], np.ndarray)
+    assert nested_list[1] == (1, 2)
+    assert isinstance(nested_list[2]['array'], np.ndarray)
+    assert isinstance(filter.coefficients, np.ndarray)
+
+
 def test_write_read_multiplePyfarObjects(
         filter,
         filterFIR,
@@ -413,6 +467,17 @@ def test_write_read_multiplePyfarObjects(
     assert dict_of_builtins.items() <= actual.items()
 
 
+@pytest.mark.parametrize("compress,compress_type", [
+    (False, zipfile.ZIP_STORED), (True, zipfile.ZIP_DEFLATED)])
+def test_write_compression(compress, compress_type, tmpdir):
+    """Check if the archive entries are only compressed on request."""
+    filename = os.path.join(tmpdir, 'compression.far')
+    io.write(filename, compress=compress, matrix=np.arange(24))
+    with zipfile.ZipFile(filename) as zip_file:
+        for info in zip_file.infolist():
+            assert info.compress_type == compress_type
+
+
 def test_write_read_multiplePyfarObjectsWithCompression(
         filter,
         filterFIR,
@@ -566,6 +566,12 @@ def test_cycle_and_toggle_signals():
     clim = _get_quad_mesh_from_axis(plt.gcf().get_axes()[0]).get_clim()
     npt.assert_allclose(clim, (-96, 4), atol=.5)
 
+    # channels are cached for cycling
+    interaction = ax[0].interaction
+    assert sorted(interaction._channel_signals) == [0, 1]
+    assert interaction.channel_signal(1) is interaction._channel_signals[1]
+    assert sorted(interaction._channel_spectrograms) == [0, 1]
+
     plt.close("all")
 
 
@@ -615,3 +621,97 @@ def test_cycle_plot_styles():
             assert cb[idx].ax.get_ylabel() == cblabel[idx]
 
         plt.close("all")
+
+
+def test_cycle_lines_blitting():
+    """Test caching and invalidation of the background used for blitting."""
+    # Use create figure to specify the plot backend
+    create_figure()
+
+    signal = pf.signals.impulse(10, [0, 1, 2])
+    ax = pf.plot.time(signal)
+    assert ax.interaction._background is None
+
+    # cycling lines caches the background
+    ax.interaction.select_action(ia.EventEmu(sc_ctr["toggle_all"]["key"][0]))
+    assert ax.interaction._background is not None
+    ax.interaction.select_action(ia.EventEmu(sc_ctr["next"]["key"][0]))
+    assert ax.interaction._background is not None
+    assert ax.lines[1].get_visible() is True
+    assert ax.interaction.txt.get_text() == "Ch. 1"
+
+    # moving the axis invalidates the background
+    ax.interaction.select_action(ia.EventEmu(sc_ctr["move_up"]["key"][0]))
+    assert ax.interaction._background is None
+
+    plt.close("all")
+
+
+def _assert_blitting_matches_full_draw(figure):
+    """Compare the current canvas to a full redraw of the figure."""
+    blitted = np.asarray(figure.canvas.buffer_rgba()).copy()
+    figure.canvas.draw()
+    npt.assert_array_equal(blitted, np.asarray(figure.canvas.buffer_rgba()))
+
+
+def test_cycle_lines_blitting_after_external_draw():
+    """Test if drawing the figure from outside invalidates the background."""
+    # Use create figure to specify the plot backend
+    create_figure()
+
+    signal = pf.signals.impulse(10, [0, 1, 2])
+    ax = pf.plot.time(signal)
+    ax.interaction.select_action(ia.EventEmu(sc_ctr["toggle_all"]["key"][0]))
+    assert ax.interaction._background is not None
+
+    # change the limits and draw, e.g., as done by the toolbar
+    ax.set_xlim(0, 1e-4)
+    ax.figure.canvas.draw()
+    assert ax.interaction._background is None
+
+    ax.interaction.select_action(ia.EventEmu(sc_ctr["next"]["key"][0]))
+    _assert_blitting_matches_full_draw(ax.figure)
+
+    plt.close("all")
+
+
+def test_cycle_lines_blitting_with_legend():
+    """Test if the legend is drawn on top of the lines when blitting."""
+    # Use create figure to specify the plot backend
+    create_figure()
+
+    signal = pf.signals.impulse(10, [0, 1, 2])
+    ax = pf.plot.time(signal, label=["a", "b", "c"])
+    ax.legend(loc="center")
+    ax.interaction.select_action(ia.EventEmu(sc_ctr["toggle_all"]["key"][0]))
+    ax.interaction.select_action(ia.EventEmu(sc_ctr["next"]["key"][0]))
+    _assert_blitting_matches_full_draw(ax.figure)
+
+    plt.close("all")
+
+
+def test_cycle_signals_while_draw_pending():
+    """Test that re-plotting is delayed until the figure was drawn."""
+    # Use create figure to specify the plot backend
+    create_figure()
+
+    signal = pf.signals.impulse(1024, amplitude=[1, 2])
+    ax, *_ = pf.plot.spectrogram(signal)
+    interaction = ax[0].interaction
+
+    # emulate a pending draw, e.g., due to auto-repeated key events
+    interaction._draw_pending = True
+    interaction.cycle_signals(ia.EventEmu(sc_ctr["next"]["key"][0]))
+    assert interaction._replot_pending is True
+    assert interaction.cycler.index == 1
+    clim = _get_quad_mesh_from_axis(plt.gcf().get_axes()[0]).get_clim()
+    npt.assert_allclose(clim, (-96, 4), atol=.5)
+
+    # the channel is re-plotted after drawing the figure
+    plt.gcf().canvas.draw()
+    assert interaction._replot_pending is False
+    clim = _get_quad_mesh_from_axis(plt.gcf().get_axes()[0]).get_clim()
+    npt.assert_allclose(clim, (-90, 10), atol=.5)
+    assert interaction.txt.get_text() == "Ch. 1"
+
+    plt.close("all")